@@ -8,31 +8,453 @@ Michaelsoft Mail Sender - 邮件自动发送器
 
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import mmap
+import base64
+import time
+import socket
+import threading
+import mimetypes
+import tempfile
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage
 import os
+import re
 import json
+import hashlib
 import sys
+import queue
+import atexit
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from datetime import datetime
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("mail_sender.log", encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from functools import partial
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 已解析的JSON文件：绝对路径 -> ((修改时间, 大小), 解析结果)
+_JSON_CACHE = {}
+
+
+def _loads(data):
+    """解析JSON数据，优先使用 orjson
+    
+    Args:
+        data (bytes): JSON数据
+    
+    Returns:
+        解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _load_json_cached(path):
+    """读取JSON文件，文件未修改时直接返回缓存的解析结果
+    
+    Args:
+        path (str): 文件路径
+    
+    Returns:
+        解析结果，调用方不应修改
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        data = _loads(f.read())
+    _JSON_CACHE[path] = (stamp, data)
+    return data
+
+
+def _dumps(obj):
+    """将对象序列化为UTF-8编码的JSON数据，优先使用 orjson
+    
+    Args:
+        obj: 要序列化的对象
+    
+    Returns:
+        bytes: JSON数据
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# 收件人之间的分隔符：逗号或分号，忽略两侧空白
+_RECIPIENT_SEP_RE = re.compile(r'\s*[,;]\s*')
+
+# tkinter 仅在启动图形界面时导入，作为库使用时无需加载 Tcl/Tk
+tk = ttk = filedialog = messagebox = None
+
+
+def _load_tkinter():
+    """导入图形界面所需的 tkinter 模块"""
+    global tk, ttk, filedialog, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, filedialog as _filedialog, messagebox as _messagebox
+        tk, ttk, filedialog, messagebox = tkinter, _ttk, _filedialog, _messagebox
+
+# 配置日志：记录先放入队列，由后台线程写入文件和控制台，发送线程不等待日志I/O
+_log_handlers = [
+    # 首次写日志时才打开文件
+    logging.FileHandler("mail_sender.log", encoding='utf-8', delay=True),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+# 普通日志攒满一批再写入文件，出现错误或程序退出时立即写入
+_file_buffer = MemoryHandler(64, flushLevel=logging.ERROR, target=_log_handlers[0])
+
+_log_queue = queue.Queue()
+_log_listener = QueueListener(_log_queue, _file_buffer, *_log_handlers[1:])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("MailSender")
 
+# 单个SMTP连接默认最多发送的邮件数，超过后重新连接以避免服务商限流
+DEFAULT_MAX_PER_CONNECTION = 1000
+# 持久连接空闲超过该时间（秒）后，复用前先用 NOOP 检查连接是否仍然可用
+NOOP_INTERVAL = 5
+# 批量发送时默认的并发连接数
+DEFAULT_POOL_SIZE = 4
+# SMTP连接默认的网络超时（秒），避免连接被防火墙静默丢弃后无限期等待
+DEFAULT_TIMEOUT = 30
+# 超过该大小的附件使用内存映射读取，避免额外复制一份文件内容
+MMAP_THRESHOLD = 1024 * 1024
+# 并发读取附件的最大线程数
+MAX_ATTACHMENT_WORKERS = 8
+# base64编码时每次处理的原始字节数，须为57的倍数以保证每行恰好76个字符
+BASE64_BLOCK_SIZE = 57 * 1024
+# 附件总大小超过该值时，先将邮件写入临时文件再用 sendfile 发送
+SPOOL_THRESHOLD = 16 * 1024 * 1024
+# SMTP服务器地址解析结果的缓存时间（秒）
+DNS_CACHE_TTL = 300
+
+# 常用邮箱服务器：(按钮文字, SMTP服务器地址, SMTP端口)
+PRESET_SERVERS = (
+    ("QQ邮箱", "smtp.qq.com", "465"),
+    ("163邮箱", "smtp.163.com", "465"),
+    ("Gmail", "smtp.gmail.com", "465"),
+    ("Outlook", "smtp.office365.com", "587"),
+)
+
+
+def _encode_base64(data):
+    """对附件内容进行base64编码，并按每行76个字符折行
+    
+    按块整体编码后再切分行，比 email 包逐行调用 binascii 快约一倍。
+    
+    Args:
+        data (bytes): 附件内容，也可以是 memoryview
+    
+    Returns:
+        str: 编码后的内容
+    """
+    lines = []
+    for i in range(0, len(data), BASE64_BLOCK_SIZE):
+        encoded = base64.b64encode(data[i:i + BASE64_BLOCK_SIZE])
+        lines.append(b'\n'.join([encoded[j:j + 76] for j in range(0, len(encoded), 76)]).decode('ascii'))
+    if not lines:
+        return ''
+    # 末尾换行并入 join，避免为拼接换行再复制一份完整的编码结果
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _quit(server):
+    """结束SMTP会话，服务器无响应时直接关闭连接
+    
+    Args:
+        server (smtplib.SMTP): SMTP连接
+    """
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _is_disconnected(error):
+    """判断发送失败是否因为连接已被服务器关闭
+    
+    Args:
+        error (Exception): 发送时抛出的异常
+    
+    Returns:
+        bool: 连接已断开返回True，否则返回False
+    """
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return any(code == 421 for code, _ in error.recipients.values())
+    return isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError, ssl.SSLEOFError))
+
+
+def _reset(server):
+    """发送 RSET 放弃当前邮件事务，连接已断开时忽略
+    
+    Args:
+        server (smtplib.SMTP): SMTP连接
+    """
+    try:
+        server.rset()
+    except smtplib.SMTPServerDisconnected:
+        pass
+
+
+def _send_envelope(server, sender, recipients, size):
+    """发送 MAIL FROM 和 RCPT TO，即 smtplib.SMTP.sendmail 中发送邮件内容之前的部分
+    
+    这一阶段出错时服务器还未收到邮件内容，可以安全地重新连接后重试。
+    
+    Args:
+        server (smtplib.SMTP): SMTP连接
+        sender (str): 发件人
+        recipients (list): 收件人列表
+        size (int): 邮件大小，服务器支持 SIZE 扩展时告知服务器
+    
+    Returns:
+        dict: 被拒绝的收件人，与 sendmail 的返回值相同
+    """
+    server.ehlo_or_helo_if_needed()
+    options = []
+    if server.does_esmtp and server.has_extn("size"):
+        options.append("size=%d" % size)
+    
+    code, resp = server.mail(sender, options)
+    if code != 250:
+        if code == 421:
+            server.close()
+        else:
+            _reset(server)
+        raise smtplib.SMTPSenderRefused(code, resp, sender)
+    
+    refused = {}
+    for recipient in recipients:
+        code, resp = server.rcpt(recipient)
+        if code not in (250, 251):
+            refused[recipient] = (code, resp)
+        if code == 421:
+            server.close()
+            raise smtplib.SMTPRecipientsRefused(refused)
+    if len(refused) == len(recipients):
+        _reset(server)
+        raise smtplib.SMTPRecipientsRefused(refused)
+    return refused
+
+
+def _send_data(server, content):
+    """发送邮件内容，在 _send_envelope 之后调用
+    
+    Args:
+        server (smtplib.SMTP): SMTP连接
+        content (bytes): 邮件内容，也可以是 _SpooledMessage
+    """
+    code, resp = server.data(content)
+    if code != 250:
+        if code == 421:
+            server.close()
+        else:
+            _reset(server)
+        raise smtplib.SMTPDataError(code, resp)
+
+
+class _SpooledMessage:
+    """写入临时文件的邮件内容，发送时直接从文件发送
+    
+    使用 DATA 命令发送时需要点转义；服务器支持 CHUNKING 时使用 BDAT 命令，内容原样发送。
+    """
+    
+    def __init__(self, dot_stuff=True):
+        self.file = tempfile.TemporaryFile()
+        self.dot_stuff = dot_stuff
+        self._size = 0
+        self._at_line_start = True
+    
+    def __len__(self):
+        # smtplib 在服务器支持 SIZE 扩展时需要邮件长度
+        return self._size
+    
+    def write(self, data):
+        if not data:
+            return
+        if not self.dot_stuff:
+            self.file.write(data)
+            self._size += len(data)
+            self._at_line_start = data.endswith(b'\n')
+            return
+        if self._at_line_start and data[:1] == b'.':
+            data = b'.' + data
+        data = data.replace(b'\n.', b'\n..')
+        self._at_line_start = data.endswith(b'\n')
+        self.file.write(data)
+        self._size += len(data)
+    
+    def finish(self):
+        """确保内容以换行结束，并刷新到文件"""
+        if not self._at_line_start:
+            self.write(b'\r\n')
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+
+
+class _ResolvingSMTP_SSL(smtplib.SMTP_SSL):
+    """连接到预先解析好的地址，TLS握手仍使用主机名进行SNI与证书校验
+    
+    连接启用TCP保活，并在提供了上次连接的TLS会话时尝试会话复用，减少重新连接时的握手往返。
+    """
+    
+    def __init__(self, host, port, resolve, tls_session=None, **kwargs):
+        # 父类构造函数会立即建立连接，因此需要先保存解析函数和TLS会话
+        self._resolve = resolve
+        self._tls_session = tls_session
+        super().__init__(host, port, **kwargs)
+    
+    def _get_socket(self, host, port, timeout):
+        error = None
+        for address in self._resolve(host, port):
+            try:
+                sock = socket.create_connection((address, port), timeout, self.source_address)
+                break
+            except OSError as e:
+                error = e
+        else:
+            raise error
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return self.context.wrap_socket(sock, server_hostname=self._host,
+                                        session=self._tls_session)
+    
+    def data(self, msg):
+        spooled = isinstance(msg, _SpooledMessage)
+        
+        # 服务器支持 CHUNKING 时用 BDAT 发送，内容无需逐行扫描和点转义
+        if spooled and not msg.dot_stuff or not spooled and self.has_extn("chunking"):
+            self.putcmd("bdat", "%d LAST" % len(msg))
+            self._send_content(msg)
+            return self.getreply()
+        
+        if not spooled:
+            return super().data(msg)
+        
+        self.putcmd("data")
+        (code, repl) = self.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, repl)
+        self._send_content(msg)
+        self.send(b".\r\n")
+        return self.getreply()
+    
+    def _send_content(self, msg):
+        if isinstance(msg, _SpooledMessage):
+            # 启用 kTLS 时 sendfile 由内核完成加密，无需经过用户态缓冲区
+            msg.file.seek(0)
+            self.sock.sendfile(msg.file)
+        else:
+            self.send(msg)
+
+
+class SMTPConnectionPool:
+    """SMTP连接池，限制同时打开的连接数和每个连接发送的邮件数"""
+    
+    def __init__(self, connect, max_conns=DEFAULT_POOL_SIZE,
+                 max_messages_per_conn=DEFAULT_MAX_PER_CONNECTION):
+        """初始化连接池
+        
+        Args:
+            connect (callable): 建立并登录新SMTP连接的函数
+            max_conns (int, optional): 最大连接数. 默认为 DEFAULT_POOL_SIZE.
+            max_messages_per_conn (int, optional): 每个连接最多发送的邮件数.
+                默认为 DEFAULT_MAX_PER_CONNECTION.
+        """
+        self._connect = connect
+        self.max_messages_per_conn = max_messages_per_conn
+        # 池中每一项为 (连接, 已发送邮件数)，空位在首次使用时才建立连接
+        self._pool = queue.Queue()
+        for _ in range(max_conns):
+            self._pool.put((None, 0))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def acquire(self):
+        """取出一个可用连接，没有空闲连接时等待
+        
+        Returns:
+            tuple: (已登录的SMTP连接, 该连接已发送的邮件数)
+        """
+        server, count = self._pool.get()
+        if server is None:
+            try:
+                server = self._connect()
+            except Exception:
+                self._pool.put((None, 0))
+                raise
+            count = 0
+        return server, count
+    
+    def release(self, server, count):
+        """归还连接，达到发送上限的连接会被关闭
+        
+        Args:
+            server (smtplib.SMTP): SMTP连接
+            count (int): 该连接已发送的邮件数
+        """
+        if count >= self.max_messages_per_conn:
+            _quit(server)
+            server, count = None, 0
+        self._pool.put((server, count))
+    
+    def discard(self, server):
+        """关闭出错的连接，并腾出空位
+        
+        Args:
+            server (smtplib.SMTP): SMTP连接
+        """
+        server.close()
+        self._pool.put((None, 0))
+    
+    def close(self):
+        """关闭池中所有空闲连接"""
+        while True:
+            try:
+                server, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if server is not None:
+                _quit(server)
+
+
 class MailSender:
     """邮件发送器核心类"""
     
+    # 所有连接共用的SSL上下文，避免每次连接都重新加载CA证书
+    _SSL_CTX = None
+    _SSL_CTX_LOCK = threading.Lock()
+    
     def __init__(self, config=None):
         """初始化邮件发送器
         
@@ -40,8 +462,38 @@ class MailSender:
             config (dict, optional): 邮件配置信息. 默认为 None.
         """
         self.config = config or {}
+        self._smtp = None
+        self._smtp_key = None
+        self._smtp_used = 0
+        self._msg_count = 0
+        self._resolved = {}
+        self._tls_sessions = {}
+        self._saved_digest = None
         self.load_config()
     
+    @classmethod
+    def _get_ssl_context(cls):
+        """获取共享的SSL上下文，首次调用时创建
+        
+        Returns:
+            ssl.SSLContext: SSL上下文
+        """
+        if cls._SSL_CTX is None:
+            with cls._SSL_CTX_LOCK:
+                if cls._SSL_CTX is None:
+                    context = ssl.create_default_context()
+                    # Linux 下尽量使用内核TLS，使大邮件可以通过 sendfile 发送
+                    if sys.platform.startswith("linux") and hasattr(ssl, "OP_ENABLE_KTLS"):
+                        context.options |= ssl.OP_ENABLE_KTLS
+                    MailSender._SSL_CTX = context
+        return cls._SSL_CTX
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def load_config(self, config_file="mail_config.json"):
         """从配置文件加载配置
         
@@ -50,13 +502,14 @@ class MailSender:
         """
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    self.config.update(json.load(f))
-                logger.info(f"配置已从 {config_file} 加载")
+                loaded = _load_json_cached(config_file)
+                self.config.update(loaded)
+                self._saved_digest = (config_file, hashlib.blake2b(_dumps(loaded)).digest())
+                logger.info("配置已从 %s 加载", config_file)
             else:
-                logger.warning(f"配置文件 {config_file} 不存在，使用默认配置")
+                logger.warning("配置文件 %s 不存在，使用默认配置", config_file)
         except Exception as e:
-            logger.error(f"加载配置文件失败: {str(e)}")
+            logger.error("加载配置文件失败: %s", e)
     
     def save_config(self, config_file="mail_config.json"):
         """保存配置到文件
@@ -65,76 +518,683 @@ class MailSender:
             config_file (str, optional): 配置文件路径. 默认为 "mail_config.json".
         """
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
-            logger.info(f"配置已保存到 {config_file}")
+            data = _dumps(self.config)
+            digest = hashlib.blake2b(data).digest()
+            if self._saved_digest == (config_file, digest) and os.path.exists(config_file):
+                logger.debug("配置未变化，跳过保存 %s", config_file)
+                return
+            
+            # 先写入临时文件再替换，避免写入中断导致配置文件损坏
+            tmp_file = config_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+            
+            self._saved_digest = (config_file, digest)
+            logger.info("配置已保存到 %s", config_file)
         except Exception as e:
-            logger.error(f"保存配置文件失败: {str(e)}")
+            logger.error("保存配置文件失败: %s", e)
     
-    def send_mail(self, recipients, subject, body, attachments=None, html=False):
-        """发送邮件
+    def _resolve(self, host, port):
+        """解析SMTP服务器地址，结果在 DNS_CACHE_TTL 秒内复用
+        
+        Args:
+            host (str): SMTP服务器地址
+            port (int): SMTP服务器端口
+        
+        Returns:
+            list: 可连接的IP地址列表
+        """
+        key = (host, port)
+        now = time.monotonic()
+        entry = self._resolved.get(key)
+        if entry is None or entry[0] <= now:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            entry = (now + DNS_CACHE_TTL, [info[4][0] for info in infos])
+            self._resolved[key] = entry
+        return entry[1]
+    
+    def _open_connection(self):
+        """建立新的SMTP连接并登录
+        
+        Returns:
+            smtplib.SMTP_SSL: 已登录的SMTP连接
+        """
+        host = self.config.get("smtp_server")
+        port = int(self.config.get("smtp_port"))
+        context = self._get_ssl_context()
+        timeout = float(self.config.get("timeout", DEFAULT_TIMEOUT))
+        session = self._tls_sessions.get((host, port))
+        try:
+            server = _ResolvingSMTP_SSL(host, port, self._resolve, session, context=context, timeout=timeout)
+        except ssl.SSLCertVerificationError:
+            # 缓存的地址可能已过期，重新解析后再试一次
+            self._resolved.pop((host, port), None)
+            self._tls_sessions.pop((host, port), None)
+            server = _ResolvingSMTP_SSL(host, port, self._resolve, context=context, timeout=timeout)
+        
+        try:
+            server.login(self.config.get("sender_email"), self.config.get("password"))
+        except Exception:
+            server.close()
+            raise
+        
+        # TLS 1.3 的会话票据在握手之后才下发，登录完成后再保存会话
+        self._tls_sessions[(host, port)] = server.sock.session
+        return server
+    
+    def _ensure_connection(self):
+        """确保存在可用的SMTP连接，必要时重新连接并登录
+        
+        Returns:
+            smtplib.SMTP_SSL: 已登录的SMTP连接
+        """
+        config = self.config
+        key = (config.get("smtp_server"), config.get("smtp_port"),
+               config.get("sender_email"), config.get("password"))
+        
+        # 配置变化后旧连接不再可用
+        if self._smtp is not None and self._smtp_key != key:
+            self.close()
+        
+        if self._smtp is not None:
+            # 刚使用过的连接无需再发送 NOOP 检查，省去一次网络往返
+            if time.monotonic() - self._smtp_used < NOOP_INTERVAL:
+                return self._smtp
+            try:
+                code = self._smtp.noop()[0]
+            except (smtplib.SMTPServerDisconnected, OSError):
+                code = None
+            # 服务器在关闭空闲连接前通常会先回复 421，非 250 的回复同样视为连接不可用
+            if code == 250:
+                self._smtp_used = time.monotonic()
+                return self._smtp
+            logger.info("SMTP连接已断开，正在重新连接")
+            self._smtp.close()
+            self._smtp = None
+        
+        server = self._open_connection()
+        self._smtp = server
+        self._smtp_key = key
+        self._smtp_used = time.monotonic()
+        self._msg_count = 0
+        return server
+    
+    def _send_on_connection(self, sender, recipients, make_content):
+        """在持久连接上发送邮件
+        
+        复用的连接可能在上次使用后已被服务器关闭（短时间内复用时不做 NOOP 检查），
+        若在发送邮件内容之前发现连接已断开，则重新连接并重试一次。
+        
+        Args:
+            sender (str): 发件人
+            recipients (list): 收件人列表
+            make_content (callable): 接收SMTP连接并返回邮件内容的函数，
+                返回 bytes 或 _SpooledMessage
+        """
+        previous = self._smtp
+        server = self._ensure_connection()
+        content = make_content(server)
+        try:
+            try:
+                _send_envelope(server, sender, recipients, len(content))
+            except Exception as e:
+                if server is not previous or not _is_disconnected(e):
+                    raise
+                logger.info("SMTP连接已断开，正在重新连接")
+                server.close()
+                self._smtp = None
+                server = self._ensure_connection()
+                _send_envelope(server, sender, recipients, len(content))
+            
+            # 邮件内容开始发送后服务器可能已经收下邮件，之后出错不再重试，避免重复投递
+            _send_data(server, content)
+        finally:
+            if isinstance(content, _SpooledMessage):
+                content.close()
+    
+    def close(self, send_quit=True):
+        """关闭当前SMTP连接
+        
+        Args:
+            send_quit (bool, optional): 是否先发送 QUIT 结束会话，为 False 时直接关闭连接. 默认为 True.
+        """
+        if self._smtp is None:
+            return
+        try:
+            if send_quit:
+                _quit(self._smtp)
+            else:
+                self._smtp.close()
+        finally:
+            self._smtp = None
+            self._smtp_key = None
+            self._msg_count = 0
+    
+    def _check_config(self, recipients):
+        """检查收件人与SMTP配置是否完整
         
         Args:
             recipients (list): 收件人列表
-            subject (str): 邮件主题
-            body (str): 邮件正文
-            attachments (list, optional): 附件路径列表. 默认为 None.
-            html (bool, optional): 是否为HTML格式. 默认为 False.
         
         Returns:
-            bool: 发送成功返回True，否则返回False
+            bool: 配置完整返回True，否则返回False
         """
         if not recipients:
             logger.error("收件人列表为空")
             return False
         
-        if not self.config.get("smtp_server") or not self.config.get("smtp_port"):
+        config = self.config
+        if not config.get("smtp_server") or not config.get("smtp_port"):
             logger.error("SMTP服务器配置不完整")
             return False
         
-        if not self.config.get("sender_email") or not self.config.get("password"):
+        if not config.get("sender_email") or not config.get("password"):
             logger.error("发件人信息配置不完整")
             return False
         
-        # 创建邮件
-        msg = MIMEMultipart()
+        return True
+    
+    def _build_message(self, recipients, subject, body, attachments=None, html=False):
+        """创建邮件
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            EmailMessage: 创建好的邮件
+        """
+        msg = EmailMessage(policy=policy.SMTP)
         msg['From'] = self.config.get("sender_email")
         msg['To'] = ", ".join(recipients)
         msg['Subject'] = subject
+        self._set_content(msg, body, attachments, html)
+        return msg
+    
+    def _build_message_bytes(self, recipients, subject, body, attachments=None, html=False):
+        """创建邮件并序列化为字节串
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
         
-        # 添加正文
-        if html:
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
+        Returns:
+            bytes: 完整的邮件内容
+        """
+        return self._build_message(recipients, subject, body, attachments, html).as_bytes()
+    
+    def _set_content(self, msg, body, attachments=None, html=False):
+        """设置邮件正文并添加附件
+        
+        Args:
+            msg (EmailMessage): 邮件
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        """
+        # 添加正文，非ASCII正文使用 base64 编码，不依赖服务器支持 8BITMIME
+        msg.set_content(body, subtype='html' if html else 'plain', charset='utf-8',
+                        cte=None if body.isascii() else 'base64')
+        
+        if not attachments:
+            return
+        
+        def build_part(file_path):
+            # 只跳过无法读取的文件，其他异常说明程序有误，不应被吞掉
+            try:
+                return self._build_attachment_part(file_path)
+            except OSError as e:
+                logger.error("添加附件 %s 失败: %s", file_path, e)
+                return None
+        
+        # 多个附件时并发读取和编码，掩盖磁盘或网络共享的读取延迟
+        attachments = list(attachments)
+        if len(attachments) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=min(MAX_ATTACHMENT_WORKERS, len(attachments))) as executor:
+                parts = list(executor.map(build_part, attachments))
         else:
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
+            parts = [build_part(attachments[0])]
         
         # 添加附件
-        if attachments:
-            for file_path in attachments:
+        for part in parts:
+            if part is None:
+                continue
+            if not msg.is_multipart():
+                msg.make_mixed()
+            msg.attach(part)
+    
+    def _build_body_bytes(self, body, attachments=None, html=False):
+        """创建不含发件人、收件人和主题的邮件内容，并序列化为字节串
+        
+        Args:
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            bytes: MIME内容头及正文
+        """
+        msg = EmailMessage(policy=policy.SMTP)
+        self._set_content(msg, body, attachments, html)
+        return msg.as_bytes()
+    
+    def _build_attachment_part(self, file_path):
+        """读取文件并创建附件
+        
+        Args:
+            file_path (str): 附件路径
+        
+        Returns:
+            EmailMessage: 附件
+        """
+        name = os.path.basename(file_path)
+        ctype, encoding = mimetypes.guess_type(name)
+        # message/* 和 multipart/* 不允许使用 base64 编码，文本文件的字符集未知，都按二进制发送
+        if (ctype is None or encoding is not None
+                or ctype.startswith(('message/', 'multipart/', 'text/'))):
+            ctype = 'application/octet-stream'
+        
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+                payload = _encode_base64(file.read())
+            else:
+                # 大文件直接从页缓存编码，不在内存中保留原始内容的副本
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 只顺序读取一遍，提示内核加大预读
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as data:
+                        payload = _encode_base64(data)
+        
+        part = EmailMessage(policy=policy.SMTP)
+        part['Content-Type'] = ctype
+        part['Content-Transfer-Encoding'] = 'base64'
+        part.add_header('Content-Disposition', 'attachment', filename=name)
+        part.set_payload(payload)
+        return part
+    
+    def _attachments_size(self, attachments):
+        """计算附件总大小，无法访问的附件不计入
+        
+        Args:
+            attachments (list): 附件路径列表
+        
+        Returns:
+            int: 附件总字节数
+        """
+        size = 0
+        for file_path in attachments or ():
+            try:
+                size += os.path.getsize(file_path)
+            except OSError:
+                pass
+        return size
+    
+    def _spool_message(self, msg, dot_stuff=True):
+        """将邮件序列化到临时文件
+        
+        Args:
+            msg (EmailMessage): 邮件
+            dot_stuff (bool, optional): 是否进行点转义，使用 BDAT 发送时不需要. 默认为 True.
+        
+        Returns:
+            _SpooledMessage: 可直接发送的邮件内容
+        """
+        spooled = _SpooledMessage(dot_stuff)
+        try:
+            BytesGenerator(spooled, policy=msg.policy).flatten(msg)
+            spooled.finish()
+        except Exception:
+            spooled.close()
+            raise
+        return spooled
+    
+    def _count_sent(self):
+        """记录持久连接上已发送的邮件数，达到上限后断开，下次发送时重新连接"""
+        self._smtp_used = time.monotonic()
+        self._msg_count += 1
+        max_per_connection = int(self.config.get("max_per_connection", DEFAULT_MAX_PER_CONNECTION))
+        if self._msg_count >= max_per_connection:
+            self.close()
+    
+    def send_mail(self, recipients, subject, body, attachments=None, html=False):
+        """发送邮件
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            bool: 发送成功返回True，否则返回False
+        """
+        if not self._check_config(recipients):
+            return False
+        
+        sender = self.config.get("sender_email")
+        
+        # 发送邮件
+        try:
+            msg = self._build_message(recipients, subject, body, attachments, html)
+            if self._attachments_size(attachments) >= SPOOL_THRESHOLD:
+                def make_content(server):
+                    return self._spool_message(msg, dot_stuff=not server.has_extn("chunking"))
+            else:
+                msg_bytes = msg.as_bytes()
+                
+                def make_content(server):
+                    return msg_bytes
+            
+            self._send_on_connection(sender, recipients, make_content)
+            self._count_sent()
+            
+            # 直接使用已生成的收件人头，只在日志输出时才转换为字符串
+            logger.info("邮件已成功发送给 %s", msg['To'])
+            return True
+        
+        except Exception as e:
+            logger.error("发送邮件失败: %s", e)
+            # 连接状态未知，下次发送时重新建立
+            self.close()
+            return False
+    
+    def send_individually(self, recipients, subject, body, attachments=None, html=False):
+        """向每个收件人单独发送一封相同内容的邮件
+        
+        正文和附件只编码一次，每封邮件只重新生成发件人、收件人和主题头。
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            list: 与 recipients 一一对应的发送结果
+        """
+        return self.send_bulk([[recipient] for recipient in recipients], subject, body, attachments, html)
+    
+    def send_bulk(self, groups, subject, body, attachments=None, html=False):
+        """在同一个SMTP会话中向多组收件人发送相同内容的邮件
+        
+        每组收件人对应一次 MAIL FROM + 多个 RCPT TO + 一次 DATA，收件人头只包含本组地址。
+        正文和附件只编码一次，所有组共用同一份字节内容。
+        所有收件人都可以互相看到时，直接用 send_mail 一次发送即可。
+        
+        Args:
+            groups (list): 收件人分组，每项为一组收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            list: 与 groups 一一对应的发送结果
+        """
+        groups = [list(group) for group in groups]
+        if not self._check_config([r for group in groups for r in group]):
+            return [False] * len(groups)
+        
+        sender = self.config.get("sender_email")
+        
+        def fold(name, value):
+            # header_store_parse 与 msg[name] = value 相同，会拒绝含换行符的值，防止注入额外的邮件头
+            return policy.SMTP.fold_binary(*policy.SMTP.header_store_parse(name, value))
+        
+        try:
+            body_bytes = self._build_body_bytes(body, attachments, html)
+            common_headers = fold('From', sender) + fold('Subject', subject)
+        except Exception as e:
+            logger.error("发送邮件失败: %s", e)
+            return [False] * len(groups)
+        
+        results = []
+        for group in groups:
+            to = ', '.join(group)
+            try:
+                data = common_headers + fold('To', to) + body_bytes
+                self._send_on_connection(sender, group, lambda server: data)
+                self._count_sent()
+                logger.info("邮件已成功发送给 %s", to)
+                results.append(True)
+            except Exception as e:
+                logger.error("发送邮件给 %s 失败: %s", to, e)
+                self.close()
+                results.append(False)
+        
+        return results
+    
+    def send_many(self, messages):
+        """通过连接池中的多个并发SMTP连接批量发送邮件
+        
+        连接数由 pool_size 配置，每个连接发送 max_per_connection 封邮件后重新连接。
+        
+        Args:
+            messages (list): 邮件列表，每项为 send_mail 的参数元组
+                (recipients, subject, body[, attachments[, html]])
+        
+        Returns:
+            list: 与 messages 一一对应的发送结果
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        messages = list(messages)
+        pool_size = min(int(self.config.get("pool_size", DEFAULT_POOL_SIZE)), len(messages))
+        
+        # 单连接时直接复用持久连接顺序发送
+        if pool_size <= 1:
+            return [self.send_mail(*m) for m in messages]
+        
+        if not self._check_config([r for m in messages for r in m[0]]):
+            return [False] * len(messages)
+        
+        max_per_connection = int(self.config.get("max_per_connection", DEFAULT_MAX_PER_CONNECTION))
+        sender = self.config.get("sender_email")
+        
+        def send_one(message):
+            recipients = message[0]
+            try:
+                msg_bytes = self._build_message_bytes(*message)
+                server, count = pool.acquire()
+            except Exception as e:
+                logger.error("发送邮件失败: %s", e)
+                return False
+            
+            while True:
                 try:
-                    with open(file_path, 'rb') as file:
-                        part = MIMEApplication(file.read(), Name=os.path.basename(file_path))
-                    part['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
-                    msg.attach(part)
+                    _send_envelope(server, sender, recipients, len(msg_bytes))
+                    break
                 except Exception as e:
-                    logger.error(f"添加附件 {file_path} 失败: {str(e)}")
+                    pool.discard(server)
+                    # 池中空闲的连接可能已被服务器关闭，此时邮件内容还未发出，换一个连接重试；
+                    # 新建的连接出错则不再重试
+                    if count == 0 or not _is_disconnected(e):
+                        logger.error("发送邮件失败: %s", e)
+                        return False
+                logger.info("SMTP连接已断开，正在重新连接")
+                try:
+                    server, count = pool.acquire()
+                except Exception as e:
+                    logger.error("发送邮件失败: %s", e)
+                    return False
+            
+            # 邮件内容开始发送后服务器可能已经收下邮件，之后出错不再重试，避免重复投递
+            try:
+                _send_data(server, msg_bytes)
+            except Exception as e:
+                logger.error("发送邮件失败: %s", e)
+                pool.discard(server)
+                return False
+            
+            pool.release(server, count + 1)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("邮件已成功发送给 %s", ", ".join(recipients))
+            return True
         
-        # 发送邮件
+        with SMTPConnectionPool(self._open_connection, pool_size, max_per_connection) as pool:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                return list(executor.map(send_one, messages))
+
+
+class AsyncMailSender(MailSender):
+    """基于 aiosmtplib 的异步邮件发送器，需要安装 aiosmtplib"""
+    
+    def __init__(self, config=None):
+        """初始化异步邮件发送器
+        
+        Args:
+            config (dict, optional): 邮件配置信息. 默认为 None.
+        """
+        if aiosmtplib is None:
+            raise ImportError("AsyncMailSender 需要安装 aiosmtplib")
+        super().__init__(config)
+    
+    async def _connect_async(self):
+        """建立新的异步SMTP连接并登录
+        
+        Returns:
+            aiosmtplib.SMTP: 已登录的SMTP连接
+        """
+        smtp = aiosmtplib.SMTP(hostname=self.config.get("smtp_server"),
+                               port=int(self.config.get("smtp_port")),
+                               use_tls=True,
+                               tls_context=self._get_ssl_context(),
+                               timeout=float(self.config.get("timeout", DEFAULT_TIMEOUT)))
+        await smtp.connect()
+        try:
+            await smtp.login(self.config.get("sender_email"), self.config.get("password"))
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+    
+    async def _quit_async(self, smtp):
+        """结束异步SMTP会话，服务器无响应时直接关闭连接
+        
+        Args:
+            smtp (aiosmtplib.SMTP): SMTP连接
+        """
         try:
-            context = ssl.create_default_context()
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+    
+    async def send_mail_async(self, recipients, subject, body, attachments=None, html=False):
+        """异步发送邮件，每次调用使用独立的SMTP连接
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list, optional): 附件路径列表. 默认为 None.
+            html (bool, optional): 是否为HTML格式. 默认为 False.
+        
+        Returns:
+            bool: 发送成功返回True，否则返回False
+        """
+        if not self._check_config(recipients):
+            return False
+        
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        
+        try:
+            # 读取附件和序列化邮件属于阻塞操作，放到线程池中执行
+            msg_bytes = await loop.run_in_executor(
+                None, self._build_message_bytes, recipients, subject, body, attachments, html)
             
-            with smtplib.SMTP_SSL(self.config.get("smtp_server"), 
-                                 int(self.config.get("smtp_port")), 
-                                 context=context) as server:
-                server.login(self.config.get("sender_email"), self.config.get("password"))
-                server.sendmail(self.config.get("sender_email"), recipients, msg.as_string())
+            smtp = await self._connect_async()
+            try:
+                await smtp.sendmail(self.config.get("sender_email"), recipients, msg_bytes)
+            finally:
+                await self._quit_async(smtp)
             
-            logger.info(f"邮件已成功发送给 {', '.join(recipients)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("邮件已成功发送给 %s", ", ".join(recipients))
             return True
         
         except Exception as e:
-            logger.error(f"发送邮件失败: {str(e)}")
+            logger.error("发送邮件失败: %s", e)
             return False
+    
+    async def send_many_async(self, messages):
+        """并发发送多封邮件，同时打开的连接数不超过 pool_size
+        
+        每个连接依次发送多封邮件，只在首次使用、出错或达到 max_per_connection 后重新连接。
+        pool_size 为 1 时所有邮件通过同一个连接发送。
+        
+        Args:
+            messages (list): 邮件列表，每项为 send_mail 的参数元组
+                (recipients, subject, body[, attachments[, html]])
+        
+        Returns:
+            list: 与 messages 一一对应的发送结果
+        """
+        import asyncio
+        
+        messages = list(messages)
+        results = [False] * len(messages)
+        if not messages:
+            return results
+        
+        pool_size = min(int(self.config.get("pool_size", DEFAULT_POOL_SIZE)), len(messages))
+        max_per_connection = int(self.config.get("max_per_connection", DEFAULT_MAX_PER_CONNECTION))
+        sender = self.config.get("sender_email")
+        loop = asyncio.get_running_loop()
+        
+        # 各连接从同一个迭代器中依次领取邮件
+        pending = iter(enumerate(messages))
+        
+        async def worker():
+            smtp = None
+            count = 0
+            try:
+                for i, message in pending:
+                    recipients = message[0]
+                    if not self._check_config(recipients):
+                        continue
+                    try:
+                        msg_bytes = await loop.run_in_executor(None, self._build_message_bytes, *message)
+                        if smtp is None:
+                            smtp = await self._connect_async()
+                            count = 0
+                        await smtp.sendmail(sender, recipients, msg_bytes)
+                    except Exception as e:
+                        logger.error("发送邮件失败: %s", e)
+                        # 连接状态未知，下一封邮件重新连接
+                        if smtp is not None:
+                            smtp.close()
+                            smtp = None
+                        continue
+                    
+                    results[i] = True
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("邮件已成功发送给 %s", ", ".join(recipients))
+                    count += 1
+                    if count >= max_per_connection:
+                        await self._quit_async(smtp)
+                        smtp = None
+            finally:
+                if smtp is not None:
+                    await self._quit_async(smtp)
+        
+        await asyncio.gather(*[worker() for _ in range(max(pool_size, 1))])
+        return results
 
 
 class MailSenderGUI:
@@ -146,21 +1206,43 @@ class MailSenderGUI:
         Args:
             root: Tkinter根窗口
         """
+        _load_tkinter()
         self.root = root
         self.root.geometry("800x600")
         self.root.minsize(800, 600)
         
         self.mail_sender = MailSender()
         self.attachments = []
+        self._sending = False
+        self._close_requested = False
         
         # 加载语言配置
         self.current_lang = "zh_CN"  # 默认中文
         self.langs = {}
         self._load_languages()
         
+        # 需要随语言切换更新文本的组件: (组件, 文本键名)
+        self._i18n_widgets = []
         self._create_widgets()
         self._load_config_to_ui()
         
+        # 在后台预先创建SSL上下文，首次发送或测试连接时无需等待加载CA证书
+        threading.Thread(target=MailSender._get_ssl_context, daemon=True).start()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+    def _on_close(self):
+        """关闭窗口时释放SMTP连接"""
+        # 邮件仍在后台发送时，等发送完成并显示结果后再关闭窗口，避免邮件被静默丢弃
+        if self._sending:
+            self._close_requested = True
+            self.status_var.set(self._get_text("close_after_send"))
+            return
+        
+        # 不等待服务器响应 QUIT，避免网络异常时关闭窗口卡住界面
+        self.mail_sender.close(send_quit=False)
+        self.root.destroy()
+    
     def _load_languages(self):
         """加载语言配置文件"""
         lang_files = ["lang_zh_CN.json", "lang_en_US.json"]
@@ -168,11 +1250,10 @@ class MailSenderGUI:
             try:
                 if os.path.exists(lang_file):
                     lang_code = lang_file.replace("lang_", "").replace(".json", "")
-                    with open(lang_file, 'r', encoding='utf-8') as f:
-                        self.langs[lang_code] = json.load(f)
-                    logger.info(f"语言配置已从 {lang_file} 加载")
+                    self.langs[lang_code] = _load_json_cached(lang_file)
+                    logger.info("语言配置已从 %s 加载", lang_file)
             except Exception as e:
-                logger.error(f"加载语言配置文件失败: {str(e)}")
+                logger.error("加载语言配置文件失败: %s", e)
         
         # 如果没有加载到任何语言文件，使用默认的中文
         if not self.langs:
@@ -183,8 +1264,11 @@ class MailSenderGUI:
                 # 其他默认值...
             }
         
+        # 当前语言的文本字典，切换语言时更新
+        self._active_lang = self.langs.get(self.current_lang, {})
+        
         # 设置窗口标题
-        self.root.title(self.langs.get(self.current_lang, {}).get("app_title", "Michaelsoft Mail Sender v1.1.0"))
+        self.root.title(self._active_lang.get("app_title", "Michaelsoft Mail Sender v1.1.0"))
     
     def _create_widgets(self):
         """创建界面组件"""
@@ -197,6 +1281,8 @@ class MailSenderGUI:
         menubar.add_cascade(label=self._get_text("language"), menu=lang_menu)
         lang_menu.add_command(label=self._get_text("lang_zh_CN"), command=lambda: self._change_language("zh_CN"))
         lang_menu.add_command(label=self._get_text("lang_en_US"), command=lambda: self._change_language("en_US"))
+        self.menubar = menubar
+        self.lang_menu = lang_menu
         
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -227,8 +1313,9 @@ class MailSenderGUI:
         # 配置页面
         self._create_config_page(config_frame)
         
-        # 帮助页面
-        self._create_help_page(help_frame)
+        # 帮助页面在首次切换到该标签页时才创建，加快启动
+        self._help_built = False
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # 状态栏
         status_frame = ttk.Frame(self.root)
@@ -252,13 +1339,29 @@ class MailSenderGUI:
         Returns:
             str: 对应语言的文本
         """
-        text = self.langs.get(self.current_lang, {}).get(key, key)
+        text = self._active_lang.get(key, key)
         if args:
             try:
                 return text.format(*args)
-            except:
+            except (IndexError, KeyError, ValueError):
                 return text
         return text
+    
+    def _i18n(self, widget_class, parent, key, **kwargs):
+        """创建带本地化文本的组件，并登记以便切换语言时原地更新
+        
+        Args:
+            widget_class: 组件类，如 ttk.Label
+            parent: 父容器
+            key: 文本键名
+            **kwargs: 传给组件构造函数的其他参数
+            
+        Returns:
+            创建的组件
+        """
+        widget = widget_class(parent, text=self._active_lang.get(key, key), **kwargs)
+        self._i18n_widgets.append((widget, key))
+        return widget
         
     def _change_language(self, lang_code):
         """切换语言
@@ -268,6 +1371,7 @@ class MailSenderGUI:
         """
         if lang_code in self.langs and lang_code != self.current_lang:
             self.current_lang = lang_code
+            self._active_lang = self.langs[lang_code]
             self._update_ui_language()
             
     def _update_ui_language(self):
@@ -280,20 +1384,35 @@ class MailSenderGUI:
         self.notebook.tab(1, text=self._get_text("tab_config"))
         self.notebook.tab(2, text=self._get_text("tab_help"))
         
+        # 更新菜单
+        self.menubar.entryconfig(0, label=self._get_text("language"))
+        self.lang_menu.entryconfig(0, label=self._get_text("lang_zh_CN"))
+        self.lang_menu.entryconfig(1, label=self._get_text("lang_en_US"))
+        
         # 更新状态栏
         self.status_var.set(self._get_text("status_ready"))
         
-        # 重新创建各页面
-        for frame in self.notebook_frames.values():
-            for widget in frame.winfo_children():
-                widget.destroy()
-                
-        self._create_send_page(self.notebook_frames["send"])
-        self._create_config_page(self.notebook_frames["config"])
-        self._create_help_page(self.notebook_frames["help"])
+        # 原地更新各组件文本，保留用户已输入的内容
+        texts = self._active_lang
+        for widget, key in self._i18n_widgets:
+            widget.configure(text=texts.get(key, key))
+        self._update_attachments_label()
         
-        # 重新加载配置到UI
-        self._load_config_to_ui()
+        if self._help_built:
+            self.help_text.config(state=tk.NORMAL)
+            self.help_text.delete("1.0", tk.END)
+            self.help_text.insert(tk.END, self._get_text("help_content"))
+            self.help_text.config(state=tk.DISABLED)
+    
+    def _on_tab_changed(self, event):
+        """切换标签页时按需创建帮助页面
+        
+        Args:
+            event: Tkinter事件
+        """
+        if not self._help_built and self.notebook.index(self.notebook.select()) == 2:
+            self._create_help_page(self.notebook_frames["help"])
+            self._help_built = True
     
     def _create_send_page(self, parent):
         """创建发送邮件页面
@@ -302,28 +1421,28 @@ class MailSenderGUI:
             parent: 父容器
         """
         # 收件人
-        ttk.Label(parent, text=self._get_text("recipients")).grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "recipients").grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
         self.recipients_entry = ttk.Entry(parent, width=70)
         self.recipients_entry.grid(row=0, column=1, sticky=tk.W+tk.E, padx=10, pady=5)
-        ttk.Label(parent, text=self._get_text("recipients_hint")).grid(row=0, column=2, sticky=tk.W, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "recipients_hint").grid(row=0, column=2, sticky=tk.W, padx=10, pady=5)
         
         # 主题
-        ttk.Label(parent, text=self._get_text("subject")).grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "subject").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
         self.subject_entry = ttk.Entry(parent, width=70)
         self.subject_entry.grid(row=1, column=1, columnspan=2, sticky=tk.W+tk.E, padx=10, pady=5)
         
         # 正文
-        ttk.Label(parent, text=self._get_text("body")).grid(row=2, column=0, sticky=tk.NW, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "body").grid(row=2, column=0, sticky=tk.NW, padx=10, pady=5)
         self.body_text = tk.Text(parent, height=15)
         self.body_text.grid(row=2, column=1, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, padx=10, pady=5)
         
         # HTML选项
         self.html_var = tk.BooleanVar()
-        html_check = ttk.Checkbutton(parent, text=self._get_text("html_format"), variable=self.html_var)
+        html_check = self._i18n(ttk.Checkbutton, parent, "html_format", variable=self.html_var)
         html_check.grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
         
         # 附件
-        ttk.Label(parent, text=self._get_text("attachments")).grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "attachments").grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
         
         attachments_frame = ttk.Frame(parent)
         attachments_frame.grid(row=4, column=1, sticky=tk.W+tk.E, padx=10, pady=5)
@@ -332,12 +1451,12 @@ class MailSenderGUI:
         self.attachments_var.set(self._get_text("no_attachments"))
         ttk.Label(attachments_frame, textvariable=self.attachments_var).pack(side=tk.LEFT)
         
-        ttk.Button(attachments_frame, text=self._get_text("add_attachment"), command=self._add_attachment).pack(side=tk.LEFT, padx=5)
-        ttk.Button(attachments_frame, text=self._get_text("clear_attachments"), command=self._clear_attachments).pack(side=tk.LEFT)
+        self._i18n(ttk.Button, attachments_frame, "add_attachment", command=self._add_attachment).pack(side=tk.LEFT, padx=5)
+        self._i18n(ttk.Button, attachments_frame, "clear_attachments", command=self._clear_attachments).pack(side=tk.LEFT)
         
         # 发送按钮
-        send_button = ttk.Button(parent, text=self._get_text("send_mail"), command=self._send_mail)
-        send_button.grid(row=5, column=1, pady=20)
+        self.send_button = self._i18n(ttk.Button, parent, "send_mail", command=self._send_mail)
+        self.send_button.grid(row=5, column=1, pady=20)
         
         # 配置网格权重
         parent.columnconfigure(1, weight=1)
@@ -350,47 +1469,46 @@ class MailSenderGUI:
             parent: 父容器
         """
         # SMTP服务器
-        ttk.Label(parent, text=self._get_text("smtp_server")).grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
-        self.smtp_server_entry = ttk.Entry(parent, width=40)
+        self._i18n(ttk.Label, parent, "smtp_server").grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
+        self.smtp_server_var = tk.StringVar()
+        self.smtp_server_entry = ttk.Entry(parent, width=40, textvariable=self.smtp_server_var)
         self.smtp_server_entry.grid(row=0, column=1, sticky=tk.W, padx=10, pady=5)
         
         # SMTP端口
-        ttk.Label(parent, text=self._get_text("smtp_port")).grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
-        self.smtp_port_entry = ttk.Entry(parent, width=10)
+        self._i18n(ttk.Label, parent, "smtp_port").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        self.smtp_port_var = tk.StringVar()
+        self.smtp_port_entry = ttk.Entry(parent, width=10, textvariable=self.smtp_port_var)
         self.smtp_port_entry.grid(row=1, column=1, sticky=tk.W, padx=10, pady=5)
         
         # 发件人邮箱
-        ttk.Label(parent, text=self._get_text("sender_email")).grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
-        self.sender_email_entry = ttk.Entry(parent, width=40)
+        self._i18n(ttk.Label, parent, "sender_email").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
+        self.sender_email_var = tk.StringVar()
+        self.sender_email_entry = ttk.Entry(parent, width=40, textvariable=self.sender_email_var)
         self.sender_email_entry.grid(row=2, column=1, sticky=tk.W, padx=10, pady=5)
         
         # 密码/授权码
-        ttk.Label(parent, text=self._get_text("password")).grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
-        self.password_entry = ttk.Entry(parent, width=40, show="*")
+        self._i18n(ttk.Label, parent, "password").grid(row=3, column=0, sticky=tk.W, padx=10, pady=5)
+        self.password_var = tk.StringVar()
+        self.password_entry = ttk.Entry(parent, width=40, show="*", textvariable=self.password_var)
         self.password_entry.grid(row=3, column=1, sticky=tk.W, padx=10, pady=5)
         
         # 常用服务器配置
-        ttk.Label(parent, text=self._get_text("common_servers")).grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
+        self._i18n(ttk.Label, parent, "common_servers").grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
         
         servers_frame = ttk.Frame(parent)
         servers_frame.grid(row=4, column=1, sticky=tk.W, padx=10, pady=5)
         
-        ttk.Button(servers_frame, text="QQ邮箱", 
-                  command=lambda: self._set_preset_server("smtp.qq.com", "465")).pack(side=tk.LEFT, padx=5)
-        ttk.Button(servers_frame, text="163邮箱", 
-                  command=lambda: self._set_preset_server("smtp.163.com", "465")).pack(side=tk.LEFT, padx=5)
-        ttk.Button(servers_frame, text="Gmail", 
-                  command=lambda: self._set_preset_server("smtp.gmail.com", "465")).pack(side=tk.LEFT, padx=5)
-        ttk.Button(servers_frame, text="Outlook", 
-                  command=lambda: self._set_preset_server("smtp.office365.com", "587")).pack(side=tk.LEFT, padx=5)
+        for name, server, port in PRESET_SERVERS:
+            ttk.Button(servers_frame, text=name,
+                       command=partial(self._set_preset_server, server, port)).pack(side=tk.LEFT, padx=5)
         
         # 保存配置按钮
-        save_button = ttk.Button(parent, text=self._get_text("save_config"), command=self._save_config)
+        save_button = self._i18n(ttk.Button, parent, "save_config", command=self._save_config)
         save_button.grid(row=5, column=1, sticky=tk.W, padx=10, pady=20)
         
         # 测试连接按钮
-        test_button = ttk.Button(parent, text=self._get_text("test_connection"), command=self._test_connection)
-        test_button.grid(row=5, column=0, sticky=tk.E, padx=10, pady=20)
+        self.test_button = self._i18n(ttk.Button, parent, "test_connection", command=self._test_connection)
+        self.test_button.grid(row=5, column=0, sticky=tk.E, padx=10, pady=20)
     
     def _create_help_page(self, parent):
         """创建帮助页面
@@ -398,13 +1516,13 @@ class MailSenderGUI:
         Args:
             parent: 父容器
         """
-        help_text = tk.Text(parent, wrap=tk.WORD, padx=10, pady=10)
-        help_text.pack(fill=tk.BOTH, expand=True)
+        self.help_text = tk.Text(parent, wrap=tk.WORD, padx=10, pady=10)
+        self.help_text.pack(fill=tk.BOTH, expand=True)
         
         help_content = self._get_text("help_content")
         
-        help_text.insert(tk.END, help_content)
-        help_text.config(state=tk.DISABLED)
+        self.help_text.insert(tk.END, help_content)
+        self.help_text.config(state=tk.DISABLED)
     
     def _load_config_to_ui(self):
         """将配置加载到界面"""
@@ -414,31 +1532,28 @@ class MailSenderGUI:
         if "language" in config and config["language"] in self.langs:
             if self.current_lang != config["language"]:
                 self.current_lang = config["language"]
+                self._active_lang = self.langs[self.current_lang]
                 # 不在这里调用 _update_ui_language，避免递归调用
         
         if "smtp_server" in config:
-            self.smtp_server_entry.delete(0, tk.END)
-            self.smtp_server_entry.insert(0, config["smtp_server"])
+            self.smtp_server_var.set(config["smtp_server"])
         
         if "smtp_port" in config:
-            self.smtp_port_entry.delete(0, tk.END)
-            self.smtp_port_entry.insert(0, config["smtp_port"])
+            self.smtp_port_var.set(config["smtp_port"])
         
         if "sender_email" in config:
-            self.sender_email_entry.delete(0, tk.END)
-            self.sender_email_entry.insert(0, config["sender_email"])
+            self.sender_email_var.set(config["sender_email"])
         
         if "password" in config:
-            self.password_entry.delete(0, tk.END)
-            self.password_entry.insert(0, config["password"])
+            self.password_var.set(config["password"])
     
     def _save_config(self):
         """保存配置"""
         config = {
-            "smtp_server": self.smtp_server_entry.get(),
-            "smtp_port": self.smtp_port_entry.get(),
-            "sender_email": self.sender_email_entry.get(),
-            "password": self.password_entry.get(),
+            "smtp_server": self.smtp_server_var.get(),
+            "smtp_port": self.smtp_port_var.get(),
+            "sender_email": self.sender_email_var.get(),
+            "password": self.password_var.get(),
             "language": self.current_lang  # 保存当前语言设置
         }
         
@@ -455,11 +1570,8 @@ class MailSenderGUI:
             server (str): SMTP服务器地址
             port (str): SMTP服务器端口
         """
-        self.smtp_server_entry.delete(0, tk.END)
-        self.smtp_server_entry.insert(0, server)
-        
-        self.smtp_port_entry.delete(0, tk.END)
-        self.smtp_port_entry.insert(0, port)
+        self.smtp_server_var.set(server)
+        self.smtp_port_var.set(port)
         
         self.status_var.set(self._get_text("server_set", server, port))
     
@@ -486,7 +1598,11 @@ class MailSenderGUI:
     
     def _send_mail(self):
         """发送邮件"""
-        recipients = [r.strip() for r in self.recipients_entry.get().split(",") if r.strip()]
+        # 上一封邮件仍在后台发送
+        if self._sending:
+            return
+        
+        recipients = [r for r in _RECIPIENT_SEP_RE.split(self.recipients_entry.get().strip()) if r]
         subject = self.subject_entry.get()
         body = self.body_text.get("1.0", tk.END)
         html = self.html_var.get()
@@ -499,45 +1615,104 @@ class MailSenderGUI:
             if not messagebox.askyesno(self._get_text("warning"), self._get_text("empty_subject")):
                 return
         
+        self._sending = True
+        self.send_button.config(state=tk.DISABLED)
         self.status_var.set(self._get_text("sending"))
-        self.root.update()
         
-        success = self.mail_sender.send_mail(recipients, subject, body, self.attachments, html)
+        # 在后台线程中发送，避免网络操作阻塞界面
+        threading.Thread(target=self._do_send,
+                         args=(recipients, subject, body, list(self.attachments), html),
+                         daemon=True).start()
+    
+    def _do_send(self, recipients, subject, body, attachments, html):
+        """在后台线程中发送邮件，完成后回到界面线程显示结果
+        
+        Args:
+            recipients (list): 收件人列表
+            subject (str): 邮件主题
+            body (str): 邮件正文
+            attachments (list): 附件路径列表
+            html (bool): 是否为HTML格式
+        """
+        success = self.mail_sender.send_mail(recipients, subject, body, attachments, html)
+        self.root.after(0, lambda: self._finish_send(success, len(recipients)))
+    
+    def _finish_send(self, success, count):
+        """显示发送结果
+        
+        Args:
+            success (bool): 是否发送成功
+            count (int): 收件人数量
+        """
+        self._sending = False
+        self.send_button.config(state=tk.NORMAL)
         
         if success:
             self.status_var.set(self._get_text("send_success"))
-            messagebox.showinfo(self._get_text("success"), self._get_text("send_success_msg", len(recipients)))
+            messagebox.showinfo(self._get_text("success"), self._get_text("send_success_msg", count))
         else:
             self.status_var.set(self._get_text("send_fail"))
             messagebox.showerror(self._get_text("error"), self._get_text("send_fail_msg"))
+        
+        if self._close_requested:
+            self._on_close()
     
     def _test_connection(self):
         """测试SMTP连接"""
-        server = self.smtp_server_entry.get()
-        port = self.smtp_port_entry.get()
-        email = self.sender_email_entry.get()
-        password = self.password_entry.get()
+        server = self.smtp_server_var.get()
+        port = self.smtp_port_var.get()
+        email = self.sender_email_var.get()
+        password = self.password_var.get()
         
         if not server or not port or not email or not password:
             messagebox.showerror(self._get_text("error"), self._get_text("incomplete_smtp"))
             return
         
+        self.test_button.config(state=tk.DISABLED)
         self.status_var.set(self._get_text("testing_connection"))
-        self.root.update()
         
+        threading.Thread(target=self._do_test_connection,
+                         args=(server, port, email, password),
+                         daemon=True).start()
+    
+    def _do_test_connection(self, server, port, email, password):
+        """在后台线程中测试SMTP连接，完成后回到界面线程显示结果
+        
+        Args:
+            server (str): SMTP服务器地址
+            port (str): SMTP服务器端口
+            email (str): 发件人邮箱
+            password (str): 密码/授权码
+        """
+        error = None
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(server, int(port), context=context) as smtp_server:
+            context = MailSender._get_ssl_context()
+            timeout = float(self.mail_sender.config.get("timeout", DEFAULT_TIMEOUT))
+            with smtplib.SMTP_SSL(server, int(port), context=context, timeout=timeout) as smtp_server:
                 smtp_server.login(email, password)
-                self.status_var.set(self._get_text("test_success"))
-                messagebox.showinfo(self._get_text("success"), self._get_text("test_success_msg"))
         except Exception as e:
+            error = e
+        self.root.after(0, lambda: self._finish_test_connection(error))
+    
+    def _finish_test_connection(self, error):
+        """显示连接测试结果
+        
+        Args:
+            error (Exception): 测试失败时的异常，成功时为 None
+        """
+        self.test_button.config(state=tk.NORMAL)
+        
+        if error is None:
+            self.status_var.set(self._get_text("test_success"))
+            messagebox.showinfo(self._get_text("success"), self._get_text("test_success_msg"))
+        else:
             self.status_var.set(self._get_text("test_fail"))
-            messagebox.showerror(self._get_text("error"), self._get_text("test_fail_msg", str(e)))
+            messagebox.showerror(self._get_text("error"), self._get_text("test_fail_msg", str(error)))
 
 
 def main():
     """主函数"""
+    _load_tkinter()
     root = tk.Tk()
     app = MailSenderGUI(root)
     
@@ -8,7 +8,6 @@ Michaelsoft Mail Toolbox - 启动脚本
 
 import os
 import sys
-import subprocess
 
 def main():
     """启动邮件发送器"""
@@ -27,16 +26,21 @@ def main():
         input("按回车键退出...")
         sys.exit(1)
     
+    # 在当前解释器中直接运行主程序，无需再启动一个Python进程
     try:
-        # 启动主程序
-        subprocess.run([sys.executable, main_script], check=True)
-    except subprocess.CalledProcessError:
-        print("程序异常退出")
+        sys.path.insert(0, script_dir)
+        import mail_sender
+    except Exception as e:
+        print(f"启动失败: {str(e)}")
         input("按回车键退出...")
+        return
+    
+    try:
+        mail_sender.main()
     except KeyboardInterrupt:
         print("程序被用户中断")
     except Exception as e:
-        print(f"启动失败: {str(e)}")
+        print(f"程序异常退出: {str(e)}")
         input("按回车键退出...")
 
 if __name__ == "__main__":